@@ -4,13 +4,58 @@ Zaifer MCP API クライアント
 Zaif暗号資産取引所のAPIにアクセスするためのクライアント実装
 """
 
-import requests
+import asyncio
+import httpx
+import orjson
 from decimal import Decimal
 from datetime import datetime
 import hmac
 import hashlib
+import threading
 import time
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Union, Tuple, Hashable, Callable, Awaitable
+from urllib.parse import quote, quote_plus
+
+from zaifer_mcp.models.market import (
+    Ticker,
+    OrderBook,
+    TradeHistory,
+    Currency,
+    CurrencyPair,
+    LastPrice,
+)
+from zaifer_mcp.models.account import (
+    AccountBalance,
+    UserProfile,
+    UserIdentification,
+    DepositRecords,
+    WithdrawalRecords,
+    WithdrawalResult,
+    AccountOverview,
+)
+from zaifer_mcp.models.trade import (
+    OrderResponse,
+    OpenOrderList,
+    CancelOrderResponse,
+    TradeExecutionList,
+)
+from zaifer_mcp.models.chart import PriceChartData
+from zaifer_mcp.models.common import to_decimal
+
+
+def encode_params(params: Dict[str, Any]) -> str:
+    """
+    リクエストパラメータをURLエンコードします。
+
+    キーはクライアント内で定義した英数字のみのため、値のみをエンコードします。
+
+    Args:
+        params: リクエストパラメータ
+
+    Returns:
+        URLエンコードされた文字列
+    """
+    return "&".join(k + "=" + quote_plus(str(v)) for k, v in params.items())
 
 
 class NonceGenerator:
@@ -18,17 +63,20 @@ class NonceGenerator:
     ノンスを生成します。
     """
 
-    @staticmethod
-    def generate() -> Decimal:
+    _lock = threading.Lock()
+    _last = 0
+
+    @classmethod
+    def generate(cls) -> str:
         """
         ノンスを生成します。
-        タイムスタンプとマイクロ秒を組み合わせて一意の値を生成します。
+        マイクロ秒単位のUNIX時刻を「秒.マイクロ秒」形式の文字列で返します。
+        同一マイクロ秒内に複数回呼び出された場合も、値が必ず増加するように調整します。
         """
-        now = datetime.now()
-        datetime_part = str(int(time.mktime(now.timetuple())))
-        second_part = "{0:06d}".format(now.microsecond)
-
-        return Decimal(datetime_part + "." + second_part)
+        with cls._lock:
+            nonce = max(time.time_ns() // 1000, cls._last + 1)
+            cls._last = nonce
+        return f"{nonce // 1_000_000}.{nonce % 1_000_000:06d}"
 
 
 class ApiKeyAuthProvider:
@@ -48,8 +96,12 @@ class ApiKeyAuthProvider:
         """
         self.api_key = api_key
         self.api_secret = api_secret
+        # 鍵のパディング処理を一度だけ行ったHMACオブジェクトを保持し、リクエスト毎に複製して使用
+        self._hmac_template = hmac.new(api_secret.encode("utf-8"), None, hashlib.sha512)
 
-    def get_auth_headers(self, params: Dict[str, Any] = None) -> Dict[str, str]:
+    def get_auth_headers(
+        self, params: Dict[str, Any] = None
+    ) -> Tuple[Dict[str, str], str]:
         """
         認証ヘッダーを取得
 
@@ -57,27 +109,202 @@ class ApiKeyAuthProvider:
             params: リクエストパラメータ
 
         Returns:
-            認証ヘッダー
+            認証ヘッダーと、署名に使用したURLエンコード済みのリクエストボディのタプル
         """
         if not params:
             params = {}
 
         # NonceGeneratorを使用してnonceを生成
-        params["nonce"] = str(NonceGenerator.generate())
+        params["nonce"] = NonceGenerator.generate()
 
         # URLエンコードされたパラメータを作成
-        from urllib.parse import urlencode
-
-        encoded_params = urlencode(params)
+        encoded_params = encode_params(params)
 
         # 署名を生成
-        signature = hmac.new(
-            self.api_secret.encode("utf-8"),
-            encoded_params.encode("utf-8"),
-            hashlib.sha512,
-        ).hexdigest()
+        mac = self._hmac_template.copy()
+        mac.update(encoded_params.encode("utf-8"))
+        signature = mac.hexdigest()
+
+        return {"key": self.api_key, "sign": signature}, encoded_params
 
-        return {"key": self.api_key, "sign": signature}
+
+class TTLCache:
+    """
+    TTL付きレスポンスキャッシュ
+
+    有効期限内はキャッシュした値をそのまま返します。
+    有効期限切れ後も猶予期限内であれば古い値を返しつつ、
+    バックグラウンドで値を再取得します（stale-while-revalidate）。
+    同じキーの取得が同時に要求された場合は、実行中の1回の取得結果を共有します。
+    """
+
+    def __init__(self, maxsize: int = 256):
+        """
+        初期化
+
+        Args:
+            maxsize: 保持するエントリの最大数
+        """
+        self.maxsize = maxsize
+        # キー -> [有効期限, 猶予期限, 値, 再取得中フラグ]
+        self._entries: Dict[Hashable, List[Any]] = {}
+        self._tasks = set()
+        # キー -> 実行中の取得タスク
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    async def get(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: float,
+        stale_ttl: float,
+    ) -> Any:
+        """
+        キャッシュから値を取得し、存在しない場合はfetchで取得してキャッシュする
+
+        Args:
+            key: キャッシュキー
+            fetch: 値を取得するコルーチン関数
+            ttl: 有効期間（秒）
+            stale_ttl: 有効期限切れ後に古い値を返してよい期間（秒）
+
+        Returns:
+            キャッシュされた値、または新たに取得した値
+        """
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None:
+            fresh_until, stale_until, value, refreshing = entry
+            if now < fresh_until:
+                return value
+            if now < stale_until:
+                if not refreshing:
+                    entry[3] = True
+                    task = asyncio.create_task(
+                        self._refresh(key, fetch, ttl, stale_ttl)
+                    )
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+                return value
+
+        # 取得中のタスクがあれば相乗りし、上流へのリクエストを1回にまとめる
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch(key, fetch, ttl, stale_ttl))
+            self._inflight[key] = task
+        # 呼び出し元がキャンセルされても、他の待機者のために取得は継続する
+        return await asyncio.shield(task)
+
+    async def _fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: float,
+        stale_ttl: float,
+    ) -> Any:
+        """
+        値を取得してキャッシュに格納する
+        """
+        try:
+            value = await fetch()
+            self._store(key, value, ttl, stale_ttl)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _refresh(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: float,
+        stale_ttl: float,
+    ) -> None:
+        """
+        バックグラウンドで値を再取得する
+        """
+        try:
+            value = await fetch()
+        except ValueError:
+            # 再取得に失敗した場合は古い値を残し、次回のアクセスで再試行する
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry[3] = False
+            return
+        self._store(key, value, ttl, stale_ttl)
+
+    def _store(self, key: Hashable, value: Any, ttl: float, stale_ttl: float) -> None:
+        """
+        値をキャッシュに格納する
+        """
+        now = time.monotonic()
+        self._entries.pop(key, None)
+        self._entries[key] = [now + ttl, now + ttl + stale_ttl, value, False]
+        if len(self._entries) > self.maxsize:
+            # 最も古く格納されたエントリを破棄
+            del self._entries[next(iter(self._entries))]
+
+
+class CircuitBreaker:
+    """
+    サーキットブレーカー
+
+    連続して一定回数失敗すると回路を開き、待機時間が経過するまでリクエストを即座に失敗させます。
+    待機時間の経過後は試行リクエストを1件だけ通し（半開状態）、成功すれば回路を閉じ、
+    失敗すれば再び待機時間だけ回路を開きます。
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        初期化
+
+        Args:
+            failure_threshold: 回路を開くまでの連続失敗回数
+            reset_timeout: 回路を開いてから試行リクエストを許可するまでの時間（秒）
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        # 試行リクエストの結果を待っている（半開状態）かどうか
+        self.half_open = False
+
+    def is_open(self) -> bool:
+        """
+        回路が開いており、リクエストを遮断すべきかどうか
+
+        待機時間の経過後は最初の1件だけを試行リクエストとして通し、
+        その結果が記録されるまで他のリクエストは遮断します。
+        試行の結果が記録されないまま再び待機時間が経過した場合は、次の1件を試行とします。
+
+        Returns:
+            遮断すべき場合はTrue（試行リクエストとして通す場合はFalse）
+        """
+        if self.opened_at is None:
+            return False
+        now = time.monotonic()
+        if now - self.opened_at < self.reset_timeout:
+            return True
+        # 試行中は待機時間を計り直し、同時に到着したリクエストを遮断する
+        self.half_open = True
+        self.opened_at = now
+        return False
+
+    def record_success(self) -> None:
+        """
+        成功を記録し、回路を閉じる
+        """
+        self.failures = 0
+        self.opened_at = None
+        self.half_open = False
+
+    def record_failure(self) -> None:
+        """
+        失敗を記録し、連続失敗回数がしきい値に達した場合や試行リクエストが失敗した場合は回路を開く
+        """
+        self.failures += 1
+        if self.half_open or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+            self.half_open = False
 
 
 class HttpClient:
@@ -85,8 +312,21 @@ class HttpClient:
     HTTPクライアント
 
     HTTPリクエストを実行するための汎用クライアント
+    接続プールを保持し、同一ホストへのTCP/TLS接続を再利用します。
     """
 
+    # 接続確立に失敗した場合の再試行回数
+    CONNECT_RETRIES = 3
+    # GETリクエストを再試行するHTTPステータス
+    RETRY_STATUSES = (502, 503, 504)
+    # GETリクエストの最大再試行回数
+    MAX_RETRIES = 3
+    # GETリクエスト再試行時の待機時間の基数（秒）。試行ごとに倍増する
+    RETRY_BACKOFF = 0.3
+    # 接続確立と応答待ちのタイムアウト（秒）
+    CONNECT_TIMEOUT = 3.05
+    READ_TIMEOUT = 10.0
+
     def __init__(self, auth_provider: Optional[ApiKeyAuthProvider] = None):
         """
         初期化
@@ -95,14 +335,101 @@ class HttpClient:
             auth_provider: 認証情報プロバイダー（認証が必要なAPIで使用）
         """
         self.auth_provider = auth_provider
+        # 接続確立の失敗はリクエスト送信前のため、GET/POSTともにトランスポート層で再試行する
+        self._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(self.READ_TIMEOUT, connect=self.CONNECT_TIMEOUT),
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20),
+                retries=self.CONNECT_RETRIES,
+            ),
+        )
+        self._cache = TTLCache()
+        # APIのベースURL -> サーキットブレーカー
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        # 認証付きPOSTを1件ずつ送信するためのロック
+        # （Zaifは直前より大きいnonceしか受け付けないため、nonceの発行から応答までを直列化する）
+        self._post_lock = asyncio.Lock()
+
+    def breaker(self, base_url: str) -> CircuitBreaker:
+        """
+        APIのベースURLに対応するサーキットブレーカーを取得
+
+        同じホストでも公開APIと取引APIでは障害の影響範囲が異なるため、ベースURLごとに分けます。
+
+        Args:
+            base_url: APIのベースURL
 
-    def get(self, url: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        Returns:
+            サーキットブレーカー
+        """
+        breaker = self._breakers.get(base_url)
+        if breaker is None:
+            breaker = self._breakers[base_url] = CircuitBreaker()
+        return breaker
+
+    async def _send(
+        self,
+        request: httpx.Request,
+        breaker: Optional[CircuitBreaker] = None,
+        retries: int = 0,
+    ) -> httpx.Response:
+        """
+        サーキットブレーカーを介してリクエストを送信
+
+        再試行を含めた1回のリクエストの結果をサーキットブレーカーに1回だけ記録します。
+        サーバーエラー（5xx）、タイムアウト、接続エラーを失敗とし、
+        障害中のAPIへのリクエストは応答を待たずに失敗させます。
+
+        Args:
+            request: 送信するリクエスト
+            breaker: 結果を記録するサーキットブレーカー（Noneの場合は記録しない）
+            retries: 一時的なサーバーエラーの場合に再試行する回数
+
+        Returns:
+            レスポンス
+
+        Raises:
+            ValueError: サーキットブレーカーが開いている場合
+        """
+        if breaker is not None and breaker.is_open():
+            raise ValueError(
+                "Service unavailable: the API is failing, requests are suspended temporarily"
+            )
+
+        try:
+            for attempt in range(retries + 1):
+                response = await self._client.send(request)
+                if (
+                    response.status_code not in self.RETRY_STATUSES
+                    or attempt == retries
+                ):
+                    break
+                await asyncio.sleep(self.RETRY_BACKOFF * (2**attempt))
+        except httpx.TransportError:
+            if breaker is not None:
+                breaker.record_failure()
+            raise
+        if breaker is not None:
+            if response.status_code >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+        return response
+
+    async def get(
+        self,
+        url: str,
+        params: Dict[str, Any] = None,
+        breaker: Optional[CircuitBreaker] = None,
+    ) -> Dict[str, Any]:
         """
         GETリクエストを送信
 
         Args:
             url: リクエスト先のURL
             params: リクエストパラメータ
+            breaker: 結果を記録するサーキットブレーカー
 
         Returns:
             レスポンス
@@ -111,24 +438,59 @@ class HttpClient:
             ValueError: HTTPエラーが発生した場合
         """
         try:
-            response = requests.get(url, params=params)
+            # 公開APIのGETは冪等のため、一時的なサーバーエラーは間隔を空けて再試行する
+            request = self._client.build_request("GET", url, params=params)
+            response = await self._send(request, breaker, self.MAX_RETRIES)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.HTTPError as e:
+            return orjson.loads(response.content)
+        except httpx.HTTPStatusError as e:
             raise ValueError(f"HTTP error: {e.response.status_code}")
-        except requests.exceptions.ConnectionError:
+        except httpx.ConnectError:
             raise ValueError(f"Connection error: Could not connect to server")
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             raise ValueError(f"Timeout error: Request timed out")
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             raise ValueError(f"Request error: {str(e)}")
         except ValueError:
             raise  # JSONデコードエラーなど
         except Exception as e:
             raise ValueError(f"Unexpected error: {str(e)}")
 
-    def post(
-        self, url: str, params: Dict[str, Any] = None, headers: Dict[str, str] = None
+    async def cached_get(
+        self,
+        url: str,
+        params: Dict[str, Any] = None,
+        ttl: float = 1.0,
+        stale_ttl: float = 0.0,
+        breaker: Optional[CircuitBreaker] = None,
+    ) -> Dict[str, Any]:
+        """
+        GETリクエストを送信し、レスポンスをTTL付きでキャッシュ
+
+        Args:
+            url: リクエスト先のURL
+            params: リクエストパラメータ
+            ttl: キャッシュの有効期間（秒）
+            stale_ttl: 有効期限切れ後、再取得中に古い値を返してよい期間（秒）
+            breaker: 結果を記録するサーキットブレーカー
+
+        Returns:
+            レスポンス
+
+        Raises:
+            ValueError: HTTPエラーが発生した場合
+        """
+        key = (url, frozenset(params.items()) if params else None)
+        return await self._cache.get(
+            key, lambda: self.get(url, params, breaker), ttl, stale_ttl
+        )
+
+    async def post(
+        self,
+        url: str,
+        params: Dict[str, Any] = None,
+        headers: Dict[str, str] = None,
+        breaker: Optional[CircuitBreaker] = None,
     ) -> Dict[str, Any]:
         """
         POSTリクエストを送信（認証が必要なAPI）
@@ -137,6 +499,7 @@ class HttpClient:
             url: リクエスト先のURL
             params: リクエストパラメータ
             headers: リクエストヘッダー
+            breaker: 結果を記録するサーキットブレーカー
 
         Returns:
             レスポンス
@@ -152,26 +515,28 @@ class HttpClient:
         if not params:
             params = {}
 
-        # 認証ヘッダーを取得
-        auth_headers = self.auth_provider.get_auth_headers(params)
-
-        # ヘッダーをマージ
-        if headers:
-            headers.update(auth_headers)
-        else:
-            headers = auth_headers
-
-        # URLエンコードされたパラメータを作成
-        from urllib.parse import urlencode
-
-        encoded_params = urlencode(params)
-
         try:
-            # URLエンコードされたデータを送信
-            response = requests.post(url, data=encoded_params, headers=headers)
+            # nonceを発行してから応答を受け取るまでロックを保持し、
+            # 同時に呼び出された場合もnonceの昇順にZaifへ到着させる
+            async with self._post_lock:
+                # 認証ヘッダーと、署名したURLエンコード済みのパラメータを取得
+                auth_headers, encoded_params = self.auth_provider.get_auth_headers(
+                    params
+                )
+
+                # ヘッダーをマージ（呼び出し元の辞書は変更せず、新規作成された認証ヘッダーに集約する）
+                if headers:
+                    auth_headers = {**headers, **auth_headers}
+                auth_headers["Content-Type"] = "application/x-www-form-urlencoded"
+
+                # URLエンコードされたデータを送信
+                request = self._client.build_request(
+                    "POST", url, content=encoded_params, headers=auth_headers
+                )
+                response = await self._send(request, breaker)
             response.raise_for_status()
 
-            result = response.json()
+            result = orjson.loads(response.content)
 
             # 元のzaiferと同様のレスポンス処理
             if result.get("success") == 0:
@@ -183,28 +548,24 @@ class HttpClient:
                 return result["return"]
 
             return result
-        except requests.exceptions.HTTPError as e:
+        except httpx.HTTPStatusError as e:
             raise ValueError(f"HTTP error: {e.response.status_code}")
-        except requests.exceptions.ConnectionError:
+        except httpx.ConnectError:
             raise ValueError(f"Connection error: Could not connect to server")
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             raise ValueError(f"Timeout error: Request timed out")
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             raise ValueError(f"Request error: {str(e)}")
         except ValueError:
             raise  # 既に適切なエラーメッセージが設定されている
         except Exception as e:
             raise ValueError(f"Unexpected error: {str(e)}")
 
-
-from zaifer_mcp.models.market import (
-    Ticker,
-    OrderBook,
-    TradeHistory,
-    Currency,
-    CurrencyPair,
-    LastPrice,
-)
+    async def aclose(self) -> None:
+        """
+        接続プールを閉じる
+        """
+        await self._client.aclose()
 
 
 class MarketApi:
@@ -224,8 +585,9 @@ class MarketApi:
         """
         self.http = http
         self.base_url = base_url
+        self.breaker = http.breaker(base_url)
 
-    def get_ticker(self, currency_pair: str) -> Ticker:
+    async def get_ticker(self, currency_pair: str) -> Ticker:
         """
         ティッカー情報を取得
 
@@ -236,24 +598,33 @@ class MarketApi:
             Tickerオブジェクト
         """
         url = f"{self.base_url}/1/ticker/{currency_pair}"
-        data = self.http.get(url)
+        data = await self.http.cached_get(
+            url, ttl=1.0, stale_ttl=2.0, breaker=self.breaker
+        )
         return Ticker.from_dict(data)
 
-    def get_depth(self, currency_pair: str) -> OrderBook:
+    async def get_depth(
+        self, currency_pair: str, limit: Optional[int] = None
+    ) -> OrderBook:
         """
         板情報を取得
 
+        Zaifの板情報APIは件数を指定できないため、取得後に最良気配から指定件数だけを変換します。
+
         Args:
             currency_pair: 通貨ペア（例: 'btc_jpy'）
+            limit: 売り・買いそれぞれの最大件数（Noneの場合はすべて）
 
         Returns:
             OrderBookオブジェクト
         """
         url = f"{self.base_url}/1/depth/{currency_pair}"
-        data = self.http.get(url)
-        return OrderBook.from_dict(data)
+        data = await self.http.cached_get(
+            url, ttl=1.0, stale_ttl=2.0, breaker=self.breaker
+        )
+        return OrderBook.from_dict(data, limit)
 
-    def get_currencies(self, currency: str = "all") -> List[Currency]:
+    async def get_currencies(self, currency: str = "all") -> List[Currency]:
         """
         通貨情報を取得
 
@@ -267,10 +638,12 @@ class MarketApi:
             url = f"{self.base_url}/1/currencies/all"
         else:
             url = f"{self.base_url}/1/currencies/{currency}"
-        data = self.http.get(url)
-        return [Currency.from_dict(item) for item in data]
+        data = await self.http.cached_get(
+            url, ttl=60.0, stale_ttl=600.0, breaker=self.breaker
+        )
+        return Currency.from_dicts(data)
 
-    def get_currency_pairs(self, currency_pair: str = "all") -> List[CurrencyPair]:
+    async def get_currency_pairs(self, currency_pair: str = "all") -> List[CurrencyPair]:
         """
         通貨ペア情報を取得
 
@@ -284,19 +657,10 @@ class MarketApi:
             url = f"{self.base_url}/1/currency_pairs/all"
         else:
             url = f"{self.base_url}/1/currency_pairs/{currency_pair}"
-        data = self.http.get(url)
-
-        return [CurrencyPair.from_dict(item) for item in data]
-
-
-from zaifer_mcp.models.account import (
-    AccountBalance,
-    UserProfile,
-    UserIdentification,
-    DepositRecords,
-    WithdrawalRecords,
-    WithdrawalResult,
-)
+        data = await self.http.cached_get(
+            url, ttl=60.0, stale_ttl=600.0, breaker=self.breaker
+        )
+        return CurrencyPair.from_dicts(data)
 
 
 class AccountApi:
@@ -306,6 +670,14 @@ class AccountApi:
     Zaifのアカウント情報APIにアクセスするためのクラス
     """
 
+    # APIメソッドごとのパラメータの雛形（呼び出し毎に複製して使用）
+    _TEMPLATES = {
+        "get_info": {"method": "get_info"},
+        "get_personal_info": {"method": "get_personal_info"},
+        "deposit_history": {"method": "deposit_history"},
+        "withdraw_history": {"method": "withdraw_history"},
+    }
+
     def __init__(self, http: HttpClient, base_url: str = "https://api.zaif.jp/tapi"):
         """
         初期化
@@ -316,30 +688,31 @@ class AccountApi:
         """
         self.http = http
         self.base_url = base_url
+        self.breaker = http.breaker(base_url)
 
-    def get_info(self) -> AccountBalance:
+    async def get_info(self) -> AccountBalance:
         """
         残高情報を取得
 
         Returns:
             AccountBalanceオブジェクト
         """
-        params = {"method": "get_info"}
-        data = self.http.post(self.base_url, params)
+        params = self._TEMPLATES["get_info"].copy()
+        data = await self.http.post(self.base_url, params, breaker=self.breaker)
         return AccountBalance.from_dict(data)
 
-    def get_personal_info(self) -> UserProfile:
+    async def get_personal_info(self) -> UserProfile:
         """
         個人情報を取得
 
         Returns:
             UserProfileオブジェクト
         """
-        params = {"method": "get_personal_info"}
-        data = self.http.post(self.base_url, params)
+        params = self._TEMPLATES["get_personal_info"].copy()
+        data = await self.http.post(self.base_url, params, breaker=self.breaker)
         return UserProfile.from_dict(data)
 
-    def get_deposit_history(
+    async def get_deposit_history(
         self,
         currency: str,
         count: int = None,
@@ -358,7 +731,8 @@ class AccountApi:
         Returns:
             DepositRecordsオブジェクト
         """
-        params = {"currency": currency}
+        params = self._TEMPLATES["deposit_history"].copy()
+        params["currency"] = currency
 
         if count is not None:
             params["count"] = count
@@ -369,11 +743,10 @@ class AccountApi:
         if end_timestamp is not None:
             params["end"] = end_timestamp
 
-        params["method"] = "deposit_history"
-        data = self.http.post(self.base_url, params)
+        data = await self.http.post(self.base_url, params, breaker=self.breaker)
         return DepositRecords.from_dict(data)
 
-    def get_withdraw_history(
+    async def get_withdraw_history(
         self,
         currency: str,
         count: int = None,
@@ -392,7 +765,8 @@ class AccountApi:
         Returns:
             WithdrawalRecordsオブジェクト
         """
-        params = {"currency": currency}
+        params = self._TEMPLATES["withdraw_history"].copy()
+        params["currency"] = currency
 
         if count is not None:
             params["count"] = count
@@ -403,12 +777,27 @@ class AccountApi:
         if end_timestamp is not None:
             params["end"] = end_timestamp
 
-        params["method"] = "withdraw_history"
-        data = self.http.post(self.base_url, params)
+        data = await self.http.post(self.base_url, params, breaker=self.breaker)
         return WithdrawalRecords.from_dict(data)
 
+    async def get_overview(self, currency: str = "jpy") -> AccountOverview:
+        """
+        残高・個人情報・入出金履歴をまとめて取得
+
+        認証付きPOSTはnonceの順に送る必要があるため、4つのAPIを順に呼び出します。
+
+        Args:
+            currency: 入出金履歴を取得する通貨コード
 
-from zaifer_mcp.models.trade import OrderResponse, OpenOrderList, CancelOrderResponse, TradeExecutionList
+        Returns:
+            AccountOverviewオブジェクト
+        """
+        return AccountOverview(
+            balance=await self.get_info(),
+            profile=await self.get_personal_info(),
+            deposits=await self.get_deposit_history(currency),
+            withdrawals=await self.get_withdraw_history(currency),
+        )
 
 
 class TradeApi:
@@ -418,6 +807,14 @@ class TradeApi:
     Zaifの取引APIにアクセスするためのクラス
     """
 
+    # APIメソッドごとのパラメータの雛形（呼び出し毎に複製して使用）
+    _TEMPLATES = {
+        "trade": {"method": "trade"},
+        "cancel_order": {"method": "cancel_order"},
+        "active_orders": {"method": "active_orders"},
+        "trade_history": {"method": "trade_history"},
+    }
+
     def __init__(self, http: HttpClient, base_url: str = "https://api.zaif.jp/tapi"):
         """
         初期化
@@ -428,8 +825,9 @@ class TradeApi:
         """
         self.http = http
         self.base_url = base_url
+        self.breaker = http.breaker(base_url)
 
-    def open_order(
+    async def open_order(
         self,
         currency_pair: str,
         action: str,
@@ -448,18 +846,16 @@ class TradeApi:
         Returns:
             OrderResponseオブジェクト
         """
-        params = {
-            "currency_pair": currency_pair,
-            "action": action,
-            "price": float(price),
-            "amount": float(amount),
-        }
-
-        params["method"] = "trade"
-        data = self.http.post(self.base_url, params)
+        params = self._TEMPLATES["trade"].copy()
+        params["currency_pair"] = currency_pair
+        params["action"] = action
+        # 浮動小数点数は最短の10進表現のまま、指数表記を使わない文字列として送信する
+        params["price"] = format(to_decimal(price), "f")
+        params["amount"] = format(to_decimal(amount), "f")
+        data = await self.http.post(self.base_url, params, breaker=self.breaker)
         return OrderResponse.from_dict(data)
 
-    def cancel_order(
+    async def cancel_order(
         self, order_id: int, currency_pair: str = None, is_token: bool = None
     ) -> CancelOrderResponse:
         """
@@ -478,7 +874,8 @@ class TradeApi:
             将来的には通貨ペアやorder_idから自動的にトークン種別を判定する機能を実装するか、
             または内部的にAPIを呼び分けるなどの方法で対応する。
         """
-        params = {"order_id": order_id}
+        params = self._TEMPLATES["cancel_order"].copy()
+        params["order_id"] = order_id
 
         if currency_pair:
             params["currency_pair"] = currency_pair
@@ -486,11 +883,10 @@ class TradeApi:
         if is_token is not None:
             params["is_token"] = is_token
 
-        params["method"] = "cancel_order"
-        data = self.http.post(self.base_url, params)
+        data = await self.http.post(self.base_url, params, breaker=self.breaker)
         return CancelOrderResponse.from_dict(data)
 
-    def get_active_orders(self, currency_pair: str = None) -> OpenOrderList:
+    async def get_active_orders(self, currency_pair: str = None) -> OpenOrderList:
         """
         有効な注文一覧を取得
 
@@ -500,16 +896,15 @@ class TradeApi:
         Returns:
             OpenOrderListオブジェクト
         """
-        params = {}
+        params = self._TEMPLATES["active_orders"].copy()
 
         if currency_pair:
             params["currency_pair"] = currency_pair
 
-        params["method"] = "active_orders"
-        data = self.http.post(self.base_url, params)
+        data = await self.http.post(self.base_url, params, breaker=self.breaker)
         return OpenOrderList.from_dict(data)
 
-    def get_trade_history(
+    async def get_trade_history(
         self,
         currency_pair: str = None,
         count: int = None,
@@ -528,7 +923,7 @@ class TradeApi:
         Returns:
             TradeExecutionListオブジェクト
         """
-        params = {}
+        params = self._TEMPLATES["trade_history"].copy()
 
         if currency_pair:
             params["currency_pair"] = currency_pair
@@ -542,14 +937,10 @@ class TradeApi:
         if end_timestamp is not None:
             params["end"] = end_timestamp
 
-        params["method"] = "trade_history"
-        data = self.http.post(self.base_url, params)
+        data = await self.http.post(self.base_url, params, breaker=self.breaker)
         return TradeExecutionList.from_dict(data)
 
 
-from zaifer_mcp.models.chart import PriceChartData
-
-
 class ChartApi:
     """
     チャート情報API
@@ -557,6 +948,16 @@ class ChartApi:
     Zaifのチャート情報APIにアクセスするためのクラス
     """
 
+    # 各期間の足1本あたりの秒数
+    PERIOD_SECONDS = {
+        "1": 60, "5": 300, "15": 900, "30": 1800, "60": 3600,
+        "240": 14400, "480": 28800, "720": 43200, "D": 86400, "W": 604800,
+    }
+    # チャートのレスポンスは大きいため、市場情報とは別の小さなキャッシュに保持する
+    CACHE_SIZE = 16
+    # 確定済みの足のみを含む過去の期間のキャッシュ有効期間（秒）
+    HISTORY_TTL = 600.0
+
     def __init__(
         self, http: HttpClient, base_url: str = "https://zaif.jp/zaif_chart_api/v1"
     ):
@@ -569,8 +970,10 @@ class ChartApi:
         """
         self.http = http
         self.base_url = base_url
+        self.breaker = http.breaker(base_url)
+        self._cache = TTLCache(maxsize=self.CACHE_SIZE)
 
-    def get_ohlc(
+    async def get_ohlc(
         self,
         currency_pair: str,
         period: str,
@@ -590,21 +993,33 @@ class ChartApi:
         Returns:
             PriceChartDataオブジェクト
         """
-        params = {
-            "symbol": currency_pair,
-            "resolution": period,
-            "from": int(from_datetime.timestamp()),
-            "to": int(to_datetime.timestamp()),
-        }
+        from_timestamp = int(from_datetime.timestamp())
+        to_timestamp = int(to_datetime.timestamp())
+
+        # パラメータの形が固定のため、クエリ文字列を直接組み立てる
+        url = (
+            f"{self.base_url}/history?symbol={quote(currency_pair, safe='')}"
+            f"&resolution={quote(period, safe='')}"
+            f"&from={from_timestamp}&to={to_timestamp}"
+        )
 
-        url = f"{self.base_url}/history"
-        response = self.http.get(url, params)
+        # 確定済みの足のみを含む過去の期間は変化しないため、長めにキャッシュする
+        # （市場情報のエントリを追い出さないよう、チャート専用のキャッシュを使用する）
+        # 未確定の足を含む期間は、有効期限切れ後に古い値を返す期間も有効期間と同じだけに抑える
+        period_seconds = self.PERIOD_SECONDS.get(period, 60)
+        if to_timestamp + period_seconds < time.time():
+            ttl = self.HISTORY_TTL
+            stale_ttl = 60.0
+        else:
+            ttl = min(period_seconds, 10.0)
+            stale_ttl = ttl
+        response = await self._cache.get(
+            url, lambda: self.http.get(url, breaker=self.breaker), ttl, stale_ttl
+        )
 
         # Zaifチャート履歴APIはJSONエンコードされた文字列を返すため、追加のパースが必要
         if isinstance(response, str):
-            import json
-
-            data = json.loads(response)
+            data = orjson.loads(response)
         else:
             data = response
         return PriceChartData.from_dict(
@@ -623,6 +1038,9 @@ class ZaifApi:
     Zaif暗号資産取引所のAPIにアクセスするためのクライアント
     """
 
+    # キープアライブ用リクエストの送信間隔（秒）
+    KEEPALIVE_INTERVAL = 25.0
+
     def __init__(
         self,
         api_key: str = None,
@@ -650,3 +1068,41 @@ class ZaifApi:
         self.account = AccountApi(self.http, trade_api_url)
         self.trade = TradeApi(self.http, trade_api_url)
         self.chart = ChartApi(self.http, chart_api_url)
+        self._keepalive_task: Optional[asyncio.Task] = None
+
+    def start_keepalive(self) -> None:
+        """
+        APIサーバーへの接続を維持するバックグラウンドタスクを開始する
+
+        取引APIと同じホストの公開APIへ定期的にリクエストを送り、アイドル状態の接続が
+        切断されないようにします。注文時にTCP/TLSの接続確立を待たずに済みます。
+        実行中のイベントループ内で呼び出してください。
+        """
+        if self._keepalive_task is None:
+            self._keepalive_task = asyncio.create_task(self._keepalive())
+
+    async def _keepalive(self) -> None:
+        """
+        一定間隔で軽量な公開APIにリクエストを送る
+        """
+        url = f"{self.market.base_url}/1/currency_pairs/btc_jpy"
+        while True:
+            await asyncio.sleep(self.KEEPALIVE_INTERVAL)
+            try:
+                # 疎通確認の失敗はサーキットブレーカーに記録しない
+                await self.http.get(url)
+            except ValueError:
+                pass  # 失敗しても次回の送信で再接続する
+
+    async def aclose(self) -> None:
+        """
+        キープアライブを停止し、HTTPクライアントの接続プールを閉じる
+        """
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            try:
+                await self._keepalive_task
+            except asyncio.CancelledError:
+                pass
+            self._keepalive_task = None
+        await self.http.aclose()
@@ -4,6 +4,7 @@
 
 from zaifer_mcp.models.common import (
     SupportedPair,
+    SUPPORTED_PAIRS,
     SupportedCurrency,
     SupportedPeriod,
     OrderType,
@@ -27,6 +28,7 @@ from zaifer_mcp.models.account import (
     WithdrawalRecords,
     WithdrawalHistoryItem,
     WithdrawalResult,
+    AccountOverview,
 )
 from zaifer_mcp.models.trade import (
     OrderResponse,
@@ -35,12 +37,14 @@ from zaifer_mcp.models.trade import (
     CancelOrderResponse,
     TradeExecutionList,
     TradeExecution,
+    AccountSnapshot,
 )
 from zaifer_mcp.models.chart import PriceChartData, CandlestickData
 
 __all__ = [
     # Common
     "SupportedPair",
+    "SUPPORTED_PAIRS",
     "SupportedCurrency",
     "SupportedPeriod",
     "OrderType",
@@ -62,6 +66,7 @@ __all__ = [
     "WithdrawalRecords",
     "WithdrawalHistoryItem",
     "WithdrawalResult",
+    "AccountOverview",
     # Trade API
     "OrderResponse",
     "OpenOrderList",
@@ -69,6 +74,7 @@ __all__ = [
     "CancelOrderResponse",
     "TradeExecution",
     "TradeExecutionList",
+    "AccountSnapshot",
     # Chart API
     "PriceChartData",
     "CandlestickData",
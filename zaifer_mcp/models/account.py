@@ -1,12 +1,16 @@
 """
 アカウント情報に関するデータモデルを提供します。
 """
+import logging
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import Dict, Any, List, Optional
-from zaifer_mcp.models.common import SupportedCurrency
+from datetime import datetime
+from zaifer_mcp.models.common import SupportedCurrency, to_decimal
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+@dataclass(slots=True, frozen=True)
 class WithdrawalResult:
     """
     出金依頼結果を表すデータクラス。
@@ -30,7 +34,7 @@ class WithdrawalResult:
         Returns:
             WithdrawalResultインスタンス
         """
-        balances = {k: Decimal(str(v)) for k, v in data.get('funds', {}).items()}
+        balances = {k: to_decimal(v) for k, v in (data.get('funds') or {}).items()}
         return cls(
             txid=data.get('txid', ''),
             balances=balances
@@ -73,7 +77,7 @@ class AccountBalance:
         Returns:
             AccountBalanceインスタンス
         """
-        balances = {k: Decimal(str(v)) for k, v in data.get('funds', {}).items()}
+        balances = {k: to_decimal(v) for k, v in (data.get('funds') or {}).items()}
         permissions = data.get('rights')
         return cls(balances=balances, permissions=permissions)
     
@@ -90,7 +94,7 @@ class AccountBalance:
         return result
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UserProfile:
     """
     ユーザープロフィール情報を表すデータクラス。
@@ -148,7 +152,7 @@ class UserProfile:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UserIdentification:
     """
     ユーザー識別情報を表すデータクラス。
@@ -207,7 +211,7 @@ class UserIdentification:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DepositHistoryItem:
     """
     入金履歴の1アイテムを表すデータクラス。
@@ -226,18 +230,17 @@ class DepositHistoryItem:
     txid: str
     
     @property
-    def datetime(self):
+    def datetime(self) -> datetime:
         """
         UNIXタイムスタンプをdatetimeに変換します。
         
         Returns:
             datetime形式の日時
         """
-        from datetime import datetime
         return datetime.fromtimestamp(self.timestamp)
 
 
-@dataclass
+@dataclass(slots=True)
 class DepositRecords:
     """
     入金履歴を表すデータクラス。
@@ -258,29 +261,40 @@ class DepositRecords:
         Returns:
             DepositRecordsインスタンス
         """
+        # ループ内で参照する名前をローカル変数に束縛し、行ごとの名前解決を省く
+        # 各行はfrozenな__init__を経由せず、スロットへ直接値を設定して生成する
         items = []
+        append = items.append
+        item_class = DepositHistoryItem
+        new = item_class.__new__
+        set_attr = object.__setattr__
+        dec = to_decimal
+        skipped = 0
         for deposit_id, item in data.items():
             if not isinstance(item, dict):
                 continue  # 辞書でない項目はスキップ
+            if not deposit_id.isdigit():
+                # IDが数値でない項目は、例外を発生させずにスキップ
+                skipped += 1
+                continue
                 
             try:
-                deposit_id_int = int(deposit_id)
-                timestamp = item.get('timestamp')
-                if timestamp is not None and timestamp != '':
-                    timestamp = int(timestamp)
-                else:
-                    timestamp = 0
-                    
-                items.append(DepositHistoryItem(
-                    id=deposit_id_int,
-                    timestamp=timestamp,
-                    address=item.get('address', ''),
-                    amount=Decimal(str(item.get('amount', '0'))),
-                    txid=item.get('txid', '')
-                ))
+                get = item.get
+                timestamp = get('timestamp')
+                obj = new(item_class)
+                set_attr(obj, 'id', int(deposit_id))
+                set_attr(obj, 'timestamp', int(timestamp) if timestamp is not None and timestamp != '' else 0)
+                set_attr(obj, 'address', get('address', ''))
+                amount = get('amount', '0')
+                set_attr(obj, 'amount', dec(amount))
+                set_attr(obj, 'txid', get('txid', ''))
+                append(obj)
             except (ValueError, TypeError, KeyError) as e:
                 # 変換エラーが発生した場合はスキップ
-                print(f"Warning: Failed to parse deposit item {deposit_id}: {e}")
+                skipped += 1
+                logger.debug("Failed to parse deposit item %s: %s", deposit_id, e)
+        if skipped:
+            logger.warning("Skipped %d malformed deposit items", skipped)
         return cls(items=items)
     
     def to_dict(self) -> List[Dict[str, Any]]:
@@ -302,7 +316,7 @@ class DepositRecords:
         ]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WithdrawalHistoryItem:
     """
     出金履歴の1アイテムを表すデータクラス。
@@ -325,18 +339,17 @@ class WithdrawalHistoryItem:
     status: str
     
     @property
-    def datetime(self):
+    def datetime(self) -> datetime:
         """
         UNIXタイムスタンプをdatetimeに変換します。
         
         Returns:
             datetime形式の日時
         """
-        from datetime import datetime
         return datetime.fromtimestamp(self.timestamp)
 
 
-@dataclass
+@dataclass(slots=True)
 class WithdrawalRecords:
     """
     出金履歴を表すデータクラス。
@@ -357,31 +370,43 @@ class WithdrawalRecords:
         Returns:
             WithdrawalRecordsインスタンス
         """
+        # ループ内で参照する名前をローカル変数に束縛し、行ごとの名前解決を省く
+        # 各行はfrozenな__init__を経由せず、スロットへ直接値を設定して生成する
         items = []
+        append = items.append
+        item_class = WithdrawalHistoryItem
+        new = item_class.__new__
+        set_attr = object.__setattr__
+        dec = to_decimal
+        skipped = 0
         for withdraw_id, item in data.items():
             if not isinstance(item, dict):
                 continue  # 辞書でない項目はスキップ
+            if not withdraw_id.isdigit():
+                # IDが数値でない項目は、例外を発生させずにスキップ
+                skipped += 1
+                continue
                 
             try:
-                withdraw_id_int = int(withdraw_id)
-                timestamp = item.get('timestamp')
-                if timestamp is not None and timestamp != '':
-                    timestamp = int(timestamp)
-                else:
-                    timestamp = 0
-                    
-                items.append(WithdrawalHistoryItem(
-                    id=withdraw_id_int,
-                    timestamp=timestamp,
-                    address=item.get('address', ''),
-                    amount=Decimal(str(item.get('amount', '0'))),
-                    txid=item.get('txid', ''),
-                    fee=Decimal(str(item.get('fee', '0'))),
-                    status=item.get('status', '')
-                ))
+                get = item.get
+                timestamp = get('timestamp')
+                obj = new(item_class)
+                set_attr(obj, 'id', int(withdraw_id))
+                set_attr(obj, 'timestamp', int(timestamp) if timestamp is not None and timestamp != '' else 0)
+                set_attr(obj, 'address', get('address', ''))
+                amount = get('amount', '0')
+                fee = get('fee', '0')
+                set_attr(obj, 'amount', dec(amount))
+                set_attr(obj, 'txid', get('txid', ''))
+                set_attr(obj, 'fee', dec(fee))
+                set_attr(obj, 'status', get('status', ''))
+                append(obj)
             except (ValueError, TypeError, KeyError) as e:
                 # 変換エラーが発生した場合はスキップ
-                print(f"Warning: Failed to parse withdraw item {withdraw_id}: {e}")
+                skipped += 1
+                logger.debug("Failed to parse withdraw item %s: %s", withdraw_id, e)
+        if skipped:
+            logger.warning("Skipped %d malformed withdraw items", skipped)
         return cls(items=items)
     
     def to_dict(self) -> List[Dict[str, Any]]:
@@ -403,3 +428,34 @@ class WithdrawalRecords:
             }
             for item in self.items
         ]
+
+
+@dataclass(slots=True)
+class AccountOverview:
+    """
+    アカウント概要（残高・個人情報・入出金履歴）を表すデータクラス。
+    
+    Attributes:
+        balance: アカウント残高情報
+        profile: ユーザープロフィール情報
+        deposits: 入金履歴
+        withdrawals: 出金履歴
+    """
+    balance: AccountBalance
+    profile: UserProfile
+    deposits: DepositRecords
+    withdrawals: WithdrawalRecords
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        AccountOverviewインスタンスを辞書に変換します。
+        
+        Returns:
+            各APIレスポンス形式をまとめた辞書
+        """
+        return {
+            'balance': self.balance.to_dict(),
+            'profile': self.profile.to_dict(),
+            'deposits': self.deposits.to_dict(),
+            'withdrawals': self.withdrawals.to_dict()
+        }
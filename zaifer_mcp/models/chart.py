@@ -2,12 +2,21 @@
 価格チャート情報に関するデータモデルを提供します。
 """
 from dataclasses import dataclass
+from types import MappingProxyType
 from decimal import Decimal
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+from zaifer_mcp.models.common import to_decimal, to_isoformat
 
+# 時間足の表示名（読み取り専用）
+_TIMEFRAME_NAMES = MappingProxyType({
+    "1": "1分足", "5": "5分足", "15": "15分足", "30": "30分足",
+    "60": "1時間足", "240": "4時間足", "480": "8時間足",
+    "720": "12時間足", "D": "日足", "W": "週足"
+})
 
-@dataclass
+
+@dataclass(slots=True)
 class CandlestickData:
     """
     ローソク足の個別データ（1つの時間足分の価格情報）を表すデータクラス。
@@ -65,28 +74,27 @@ class PriceChartData:
         Returns:
             PriceChartDataインスタンス
         """
+        # ループ内で参照する関数はローカル変数に束縛しておく
         candlesticks = []
+        append = candlesticks.append
+        candle = CandlestickData
+        dec = to_decimal
+        isoformat = to_isoformat
         for item in data.get('ohlc_data', []):
+            get = item.get
             # ミリ秒単位のタイムスタンプをISO 8601形式に変換
-            timestamp_ms = int(item.get('time', 0))
-            timestamp_iso = datetime.fromtimestamp(timestamp_ms / 1000).isoformat()
-            
-            candlesticks.append(CandlestickData(
-                timestamp=timestamp_iso,
-                open_price=Decimal(str(item.get('open', '0'))),
-                high_price=Decimal(str(item.get('high', '0'))),
-                low_price=Decimal(str(item.get('low', '0'))),
-                close_price=Decimal(str(item.get('close', '0'))),
-                volume=Decimal(str(item.get('volume', '0')))
+            timestamp_ms = int(get('time', 0))
+            append(candle(
+                isoformat(timestamp_ms / 1000),
+                dec(get('open', '0')),
+                dec(get('high', '0')),
+                dec(get('low', '0')),
+                dec(get('close', '0')),
+                dec(get('volume', '0'))
             ))
         
         # 時間足の表示名を生成
-        timeframe_names = {
-            "1": "1分足", "5": "5分足", "15": "15分足", "30": "30分足",
-            "60": "1時間足", "240": "4時間足", "480": "8時間足", 
-            "720": "12時間足", "D": "日足", "W": "週足"
-        }
-        timeframe_display = timeframe_names.get(timeframe, f"{timeframe}足")
+        timeframe_display = _TIMEFRAME_NAMES.get(timeframe, f"{timeframe}足")
         
         return cls(
             currency_pair=currency_pair,
@@ -97,6 +105,32 @@ class PriceChartData:
             data_count=int(data.get('data_count', 0))
         )
     
+    @classmethod
+    def from_ohlc_response(cls, ohlc: 'PriceChartData', currency_pair: str, timeframe: str, start_date: str, end_date: str) -> 'PriceChartData':
+        """
+        取得済みのPriceChartDataから、表示用の情報を差し替えたインスタンスを作成します。
+        
+        ローソク足データは文字列を経由した再変換を行わず、そのまま引き継ぎます。
+        
+        Args:
+            ohlc: ZaifApi.chart.get_ohlcの戻り値
+            currency_pair: 通貨ペア
+            timeframe: 時間足
+            start_date: 開始日時（ISO 8601形式）
+            end_date: 終了日時（ISO 8601形式）
+            
+        Returns:
+            PriceChartDataインスタンス
+        """
+        return cls(
+            currency_pair=currency_pair,
+            timeframe=_TIMEFRAME_NAMES.get(timeframe, f"{timeframe}足"),
+            start_date=start_date,
+            end_date=end_date,
+            candlesticks=ohlc.candlesticks,
+            data_count=ohlc.data_count
+        )
+    
     def to_dict(self) -> Dict[str, Any]:
         """
         PriceChartDataインスタンスをAPIレスポンス形式の辞書に変換します。
@@ -1,11 +1,23 @@
 """
 共通のデータ型や定数を定義するモジュール
 """
-from typing import Literal
+from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Literal, Union, get_args
+
+# ciso8601がインストールされていれば、C実装の高速なISO 8601パーサーを使用する
+try:
+    from ciso8601 import parse_datetime as parse_isoformat
+except ImportError:
+    parse_isoformat = datetime.fromisoformat
 
 # 対応する通貨ペアを明示的に制限
 SupportedPair = Literal["btc_jpy", "eth_jpy", "xym_jpy"]
 
+# 対応する通貨ペアの集合（SupportedPairから導出）
+SUPPORTED_PAIRS = frozenset(get_args(SupportedPair))
+
 # 対応する通貨を明示的に制限
 SupportedCurrency = Literal["btc", "eth", "xym", "jpy"]
 
@@ -14,3 +26,45 @@ SupportedPeriod = Literal["1", "5", "15", "30", "60", "240", "480", "720", "D",
 
 # 注文タイプ
 OrderType = Literal["bid", "ask"]
+
+# 頻出するゼロ値は同一のインスタンスを共有する（Decimalは不変のため安全）
+_ZERO = Decimal(0)
+
+
+def to_decimal(value: Any) -> Decimal:
+    """
+    APIレスポンスの数値をDecimalに変換します。
+
+    文字列と整数はそのまま変換し、浮動小数点数のみ文字列表現を経由して変換します。
+    ゼロ（0 および "0"）は共有のインスタンスを返します。
+
+    Args:
+        value: 変換する値
+
+    Returns:
+        Decimal値
+    """
+    value_type = type(value)
+    if value_type is Decimal:
+        return value
+    if value_type is str:
+        return _ZERO if value == "0" else Decimal(value)
+    if value_type is int:
+        return _ZERO if value == 0 else Decimal(value)
+    return Decimal(repr(value))
+
+
+@lru_cache(maxsize=4096)
+def to_isoformat(timestamp: Union[int, float]) -> str:
+    """
+    UNIXタイムスタンプ（秒）をローカル時刻のISO 8601形式の文字列に変換します。
+
+    同じ注文・約定・ローソク足は繰り返し取得されるため、変換結果をキャッシュします。
+
+    Args:
+        timestamp: UNIXタイムスタンプ（秒）
+
+    Returns:
+        ISO 8601形式の文字列（例: '2023-01-01T09:00:00'）
+    """
+    return datetime.fromtimestamp(timestamp).isoformat()
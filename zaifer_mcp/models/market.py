@@ -1,13 +1,14 @@
 """
 市場情報に関するデータモデルを提供します。
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import Dict, Any, List, Tuple, ClassVar, Optional
 from datetime import datetime
+from zaifer_mcp.models.common import to_decimal
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Currency:
     """
     通貨情報を表すデータクラス。
@@ -35,6 +36,20 @@ class Currency:
             is_token=data['is_token']
         )
     
+    @classmethod
+    def from_dicts(cls, rows: List[Dict[str, Any]]) -> List['Currency']:
+        """
+        APIレスポンスのリストからCurrencyインスタンスのリストを一括で作成します。
+        
+        Args:
+            rows: APIレスポンスのリスト
+            
+        Returns:
+            Currencyインスタンスのリスト
+        """
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
+    
     def to_dict(self) -> Dict[str, Any]:
         """
         Currencyインスタンスを辞書に変換します。
@@ -48,7 +63,7 @@ class Currency:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CurrencyPair:
     """
     LLM向けに最適化された通貨ペア制約情報を表すデータクラス。
@@ -88,14 +103,28 @@ class CurrencyPair:
         
         return cls(
             currency_pair=data['currency_pair'],
-            min_quantity=Decimal(str(data['item_unit_min'])),
-            quantity_step=Decimal(str(data['item_unit_step'])),
-            min_price=Decimal(str(data['aux_unit_min'])),
-            price_step=Decimal(str(data['aux_unit_step'])),
+            min_quantity=to_decimal(data['item_unit_min']),
+            quantity_step=to_decimal(data['item_unit_step']),
+            min_price=to_decimal(data['aux_unit_min']),
+            price_step=to_decimal(data['aux_unit_step']),
             price_precision=int(data['aux_unit_point']),
             display_name=display_name
         )
     
+    @classmethod
+    def from_dicts(cls, rows: List[Dict[str, Any]]) -> List['CurrencyPair']:
+        """
+        APIレスポンスのリストからCurrencyPairインスタンスのリストを一括で作成します。
+        
+        Args:
+            rows: APIレスポンスのリスト
+            
+        Returns:
+            CurrencyPairインスタンスのリスト
+        """
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
+    
     def to_dict(self) -> Dict[str, Any]:
         """
         CurrencyPairインスタンスを辞書に変換します。
@@ -114,7 +143,7 @@ class CurrencyPair:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LastPrice:
     """
     現在の終値を表すデータクラス。
@@ -136,7 +165,7 @@ class LastPrice:
             LastPriceインスタンス
         """
         return cls(
-            last_price=Decimal(str(data['last_price']))
+            last_price=to_decimal(data['last_price'])
         )
     
     def to_dict(self) -> Dict[str, Any]:
@@ -183,12 +212,12 @@ class Ticker:
             Tickerインスタンス
         """
         return cls(
-            last_price=Decimal(str(data['last'])),
-            high_price=Decimal(str(data['high'])),
-            low_price=Decimal(str(data['low'])),
-            ask_price=Decimal(str(data['ask'])),
-            bid_price=Decimal(str(data['bid'])),
-            volume=Decimal(str(data['volume']))
+            last_price=to_decimal(data['last']),
+            high_price=to_decimal(data['high']),
+            low_price=to_decimal(data['low']),
+            ask_price=to_decimal(data['ask']),
+            bid_price=to_decimal(data['bid']),
+            volume=to_decimal(data['volume'])
         )
     
     def to_dict(self) -> Dict[str, Any]:
@@ -208,7 +237,7 @@ class Ticker:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OrderBookItem:
     """
     板情報の1アイテムを表すデータクラス。
@@ -234,20 +263,22 @@ class OrderBook:
     bids: List[OrderBookItem]
     
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'OrderBook':
+    def from_dict(cls, data: Dict[str, Any], limit: Optional[int] = None) -> 'OrderBook':
         """
         APIレスポンスからOrderBookインスタンスを作成します。
         
         Args:
             data: APIレスポンスの辞書
+            limit: 売り・買いそれぞれで取り込む最良気配からの件数（Noneの場合はすべて）
             
         Returns:
             OrderBookインスタンス
         """
-        asks = [OrderBookItem(Decimal(str(item[0])), Decimal(str(item[1]))) 
-                for item in data.get('asks', [])]
-        bids = [OrderBookItem(Decimal(str(item[0])), Decimal(str(item[1]))) 
-                for item in data.get('bids', [])]
+        # 取り込む範囲だけを切り出してから変換する（APIレスポンスの辞書は変更しない）
+        asks = [OrderBookItem(to_decimal(item[0]), to_decimal(item[1])) 
+                for item in data.get('asks', [])[:limit]]
+        bids = [OrderBookItem(to_decimal(item[0]), to_decimal(item[1])) 
+                for item in data.get('bids', [])[:limit]]
         return cls(asks=asks, bids=bids)
     
     def to_dict(self) -> Dict[str, Any]:
@@ -263,7 +294,7 @@ class OrderBook:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TradeHistoryItem:
     """
     取引履歴の1アイテムを表すデータクラス。
@@ -278,19 +309,27 @@ class TradeHistoryItem:
     price: Decimal
     amount: Decimal
     trade_type: str
+    # datetimeプロパティの変換結果（初回アクセス時に設定）
+    _datetime: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
     
     @property
     def datetime(self) -> datetime:
         """
         UNIXタイムスタンプをdatetimeに変換します。
         
+        変換結果はインスタンスに保持し、2回目以降のアクセスでは再計算しません。
+        
         Returns:
             datetime形式の日時
         """
-        return datetime.fromtimestamp(self.date)
+        value = self._datetime
+        if value is None:
+            value = datetime.fromtimestamp(self.date)
+            object.__setattr__(self, '_datetime', value)
+        return value
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeHistory:
     """
     取引履歴を表すデータクラス。
@@ -314,8 +353,8 @@ class TradeHistory:
         items = [
             TradeHistoryItem(
                 date=int(item['date']),
-                price=Decimal(str(item['price'])),
-                amount=Decimal(str(item['amount'])),
+                price=to_decimal(item['price']),
+                amount=to_decimal(item['amount']),
                 trade_type=item['trade_type']
             )
             for item in data
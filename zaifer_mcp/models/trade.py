@@ -2,10 +2,24 @@
 取引情報に関するデータモデルを提供します。
 """
 
+import logging
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import Dict, Any, List, Optional
-from datetime import datetime
+from zaifer_mcp.models.common import to_decimal, to_isoformat
+
+logger = logging.getLogger(__name__)
+
+# (action, your_action) -> (trade_side, market_role)
+_TRADE_SIDE_ROLE = {
+    ("bid", "bid"): ("buy", "taker"),
+    ("ask", "bid"): ("buy", "maker"),
+    ("ask", "ask"): ("sell", "taker"),
+    ("bid", "ask"): ("sell", "maker"),
+}
+
+# 約定側が判定できない場合に、your_action のみから決まる trade_side
+_TRADE_SIDE = {"bid": "buy", "ask": "sell"}
 
 
 @dataclass
@@ -37,10 +51,10 @@ class OrderResponse:
         Returns:
             OrderResponseインスタンス
         """
-        balances = {k: Decimal(str(v)) for k, v in data.get("funds", {}).items()}
+        balances = {k: to_decimal(v) for k, v in data.get("funds", {}).items()}
         return cls(
-            filled_amount=Decimal(str(data.get("received", "0"))),
-            unfilled_amount=Decimal(str(data.get("remains", "0"))),
+            filled_amount=to_decimal(data.get("received", "0")),
+            unfilled_amount=to_decimal(data.get("remains", "0")),
             order_id=int(data.get("order_id", 0)),
             balances=balances,
         )
@@ -60,7 +74,7 @@ class OrderResponse:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OpenOrder:
     """
     未約定注文の情報を表すデータクラス。
@@ -103,19 +117,22 @@ class OpenOrderList:
         Returns:
             OpenOrderListインスタンス
         """
+        # ループ内で参照する関数はローカル変数に束縛しておく
         open_orders = {}
+        order = OpenOrder
+        dec = to_decimal
+        isoformat = to_isoformat
         for order_id_str, order_data in data.items():
-            if order_id_str.isdigit():  # 注文IDのみを処理
-                order_id = int(order_id_str)
-                open_orders[order_id] = OpenOrder(
-                    currency_pair=order_data.get("currency_pair", ""),
-                    order_type=order_data.get("action", ""),
-                    price=Decimal(str(order_data.get("price", "0"))),
-                    quantity=Decimal(str(order_data.get("amount", "0"))),
-                    order_time=datetime.fromtimestamp(
-                        int(order_data.get("timestamp", 0))
-                    ).isoformat(),
-                )
+            if not order_id_str.isdigit():  # 注文IDのみを処理
+                continue
+            get = order_data.get
+            open_orders[int(order_id_str)] = order(
+                currency_pair=get("currency_pair", ""),
+                order_type=get("action", ""),
+                price=dec(get("price", "0")),
+                quantity=dec(get("amount", "0")),
+                order_time=isoformat(int(get("timestamp", 0))),
+            )
         return cls(open_orders=open_orders)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -162,7 +179,7 @@ class CancelOrderResponse:
         Returns:
             CancelOrderResponseインスタンス
         """
-        balances = {k: Decimal(str(v)) for k, v in data.get("funds", {}).items()}
+        balances = {k: to_decimal(v) for k, v in data.get("funds", {}).items()}
         return cls(order_id=int(data.get("order_id", 0)), balances=balances)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -178,7 +195,7 @@ class CancelOrderResponse:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TradeExecution:
     """
     約定済み取引の情報を表すデータクラス。
@@ -227,63 +244,63 @@ class TradeExecutionList:
         Returns:
             TradeExecutionListインスタンス
         """
+        # ループ内で参照する関数はローカル変数に束縛しておく
         executions = []
+        append = executions.append
+        execution = TradeExecution
+        dec = to_decimal
+        isoformat = to_isoformat
+        side_roles = _TRADE_SIDE_ROLE
+        sides = _TRADE_SIDE
+        skipped = 0
         for trade_id, item in data.items():
             if not isinstance(item, dict):
                 continue  # 辞書でない項目はスキップ
+            if not trade_id.isdigit():
+                # IDが数値でない項目は、例外を発生させずにスキップ
+                skipped += 1
+                continue
 
             try:
                 trade_id_int = int(trade_id)
 
-                timestamp = item.get("timestamp")
+                get = item.get
+                timestamp = get("timestamp")
                 if timestamp is not None and timestamp != "":
-                    execution_time = datetime.fromtimestamp(int(timestamp)).isoformat()
+                    execution_time = isoformat(int(timestamp))
                 else:
                     execution_time = None
 
                 # action と your_action から trade_side と market_role を決定
-                action = item.get("action", "")
-                your_action = item.get("your_action", "")
+                action = get("action", "")
+                your_action = get("your_action", "")
 
-                # trade_side の決定
                 if your_action == "both":
-                    trade_side = "self"
-                elif your_action == "bid":
-                    trade_side = "buy"
-                elif your_action == "ask":
-                    trade_side = "sell"
+                    trade_side, market_role = "self", "both"
                 else:
-                    trade_side = "unknown"
+                    side_role = side_roles.get((action, your_action))
+                    if side_role is None:
+                        side_role = (sides.get(your_action, "unknown"), "unknown")
+                    trade_side, market_role = side_role
 
-                # market_role の決定
-                if your_action == "both":
-                    market_role = "both"
-                elif (action == "bid" and your_action == "bid") or (
-                    action == "ask" and your_action == "ask"
-                ):
-                    market_role = "taker"
-                elif (action == "bid" and your_action == "ask") or (
-                    action == "ask" and your_action == "bid"
-                ):
-                    market_role = "maker"
-                else:
-                    market_role = "unknown"
-
-                executions.append(
-                    TradeExecution(
+                append(
+                    execution(
                         execution_id=trade_id_int,
-                        currency_pair=item.get("currency_pair", ""),
+                        currency_pair=get("currency_pair", ""),
                         trade_side=trade_side,
-                        price=Decimal(str(item.get("price", "0"))),
-                        quantity=Decimal(str(item.get("amount", "0"))),
-                        fee_amount=Decimal(str(item.get("fee", "0"))),
+                        price=dec(get("price", "0")),
+                        quantity=dec(get("amount", "0")),
+                        fee_amount=dec(get("fee", "0")),
                         market_role=market_role,
                         execution_time=execution_time,
                     )
                 )
             except (ValueError, TypeError, KeyError) as e:
                 # 変換エラーが発生した場合はスキップ
-                print(f"Warning: Failed to parse trade item {trade_id}: {e}")
+                skipped += 1
+                logger.debug("Failed to parse trade item %s: %s", trade_id, e)
+        if skipped:
+            logger.warning("Skipped %d malformed trade items", skipped)
         return cls(executions=executions)
 
     def to_dict(self) -> List[Dict[str, Any]]:
@@ -310,3 +327,30 @@ class TradeExecutionList:
 
             result.append(trade_dict)
         return result
+
+
+@dataclass
+class AccountSnapshot:
+    """
+    未約定注文一覧と約定済み取引履歴をまとめたデータクラス。
+    get_active_ordersとget_trade_historyの戻り値をまとめたものに対応します。
+
+    Attributes:
+        open_orders: 未約定注文一覧
+        trade_executions: 約定済み取引履歴
+    """
+
+    open_orders: OpenOrderList
+    trade_executions: TradeExecutionList
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        AccountSnapshotインスタンスを辞書に変換します。
+
+        Returns:
+            各APIレスポンス形式をまとめた辞書
+        """
+        return {
+            "open_orders": self.open_orders.to_dict(),
+            "trade_executions": self.trade_executions.to_dict(),
+        }
@@ -8,6 +8,7 @@ Zaif暗号資産取引所のAPIをModel Context Protocol (MCP)経由で直接利
 """
 
 import os
+import anyio
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 from zaifer_mcp.api.client import ZaifApi
@@ -71,6 +72,24 @@ def create_mcp_server(zaif_api: ZaifApi, **server_config) -> FastMCP:
     return mcp
 
 
+async def serve(mcp: FastMCP, zaif_api: ZaifApi, transport: str) -> None:
+    """MCPサーバーを実行し、終了時にAPIクライアントの接続プールを閉じる"""
+    # FastMCPのlifespanはHTTPトランスポートではセッションごとに実行されるため、
+    # 接続プールはサーバー全体の終了時に閉じる
+    try:
+        # 認証情報がある場合は注文に備えて取引APIホストへの接続を維持する
+        if zaif_api.http.auth_provider:
+            zaif_api.start_keepalive()
+        if transport == 'stdio':
+            await mcp.run_stdio_async()
+        elif transport == 'streamable-http':
+            await mcp.run_streamable_http_async()
+        else:
+            raise ValueError(f"Unknown transport: {transport}")
+    finally:
+        await zaif_api.aclose()
+
+
 def run_server(debug=False, transport='stdio', port=8000, host="0.0.0.0", env_file='.env'):
     """
     MCPサーバーを実行する
@@ -109,7 +128,7 @@ def run_server(debug=False, transport='stdio', port=8000, host="0.0.0.0", env_fi
     # 5. サーバー作成・実行
     try:
         mcp = create_mcp_server(zaif_api, **server_config)
-        mcp.run(transport=transport)
+        anyio.run(serve, mcp, zaif_api, transport)
         return 0
     except ValueError as e:
         if "Unknown transport" in str(e):
@@ -0,0 +1,292 @@
+"""
+MCPツールの説明文
+
+各ツールのLLM向けの説明文（description）を、ツール名をキーとして定義します。
+"""
+
+DESCRIPTIONS = {
+    "get_ticker": """\
+指定した通貨ペアのティッカー情報を取得します。
+
+現在の市場価格統計を提供し、以下の用途で使用します：
+- 現在の市場価格と24時間の価格変動を確認したい場合
+- 売買注文の価格設定の参考にしたい場合
+- 市場の活発さ（取引量）を把握したい場合
+
+使用例:
+- ビットコインの現在価格を確認したい場合
+- 最適な注文価格を決定するため最良売買価格を確認したい場合
+- 24時間の価格レンジを分析したい場合
+
+Args:
+    currency_pair: 通貨ペア（'btc_jpy': ビットコイン/円、'eth_jpy': イーサリアム/円、'xym_jpy': シンボル/円）
+
+Returns:
+    Ticker: ティッカー情報
+        - last_price: 最終取引価格
+        - high_price: 24時間最高値
+        - low_price: 24時間最安値
+        - ask_price: 最良売り価格
+        - bid_price: 最良買い価格
+        - volume: 24時間取引量
+
+Raises:
+    ValueError: 通貨ペアが無効な場合や、APIエラーが発生した場合""",
+    "get_market_depth": """\
+指定した通貨ペアの板情報を取得します。
+
+市場全体の売買注文状況を表示し、あなた個人の注文一覧（get_open_orders）とは異なります。
+全市場参加者の注文が価格順に並んだ情報で、以下の用途で使用します：
+- 市場の流動性と売買圧力を分析したい場合
+- 大量注文前に市場の深さを確認したい場合
+- サポート・レジスタンスレベルを特定したい場合
+
+使用例:
+- 大きな注文を出す前に市場の流動性を確認したい場合
+- 現在のビッド・アスクスプレッドを詳細に分析したい場合
+- 特定価格帯での注文量を確認したい場合
+
+注意: 件数を増やすほど応答サイズと処理時間が増えます。
+通常はスプレッドや直近の厚みを見るには既定の20件で十分です。
+
+Args:
+    currency_pair: 通貨ペア（'btc_jpy': ビットコイン/円、'eth_jpy': イーサリアム/円、'xym_jpy': シンボル/円）
+    limit: 売り・買いそれぞれで取得する最良気配からの件数（1〜200、デフォルト: 20）
+
+Returns:
+    OrderBook: 市場全体の板情報
+        - asks: 売り注文一覧（price・quantity、最良気配から順に最大limit件）
+        - bids: 買い注文一覧（price・quantity、最良気配から順に最大limit件）
+
+Raises:
+    ValueError: 通貨ペアやlimitが無効な場合や、APIエラーが発生した場合""",
+    "get_currency_pairs": """\
+対応している通貨ペア情報を取得します。
+
+取引可能な通貨ペアの詳細な制約情報を提供し、以下の用途で使用します：
+- 注文前に最小数量・価格制約を確認したい場合
+- 有効な注文パラメータを計算したい場合
+- 通貨ペアの取引ルールを理解したい場合
+
+使用例:
+- ビットコインの最小注文数量を確認したい場合
+- 価格の刻み幅に合わせて注文価格を調整したい場合
+- 通貨ペアごとの制約の違いを比較したい場合
+
+Returns:
+    list[CurrencyPair]: 通貨ペア情報のリスト
+        - currency_pair: 通貨ペア識別子（例: 'btc_jpy'）
+        - min_quantity: 最小注文数量
+        - quantity_step: 注文数量の刻み幅
+        - min_price: 最小注文価格
+        - price_step: 注文価格の刻み幅
+        - price_precision: 価格表示の小数点桁数
+        - display_name: 表示用名称（例: 'ビットコイン/円'）
+
+Raises:
+    ValueError: APIエラーが発生した場合""",
+    "get_account_balance": """\
+アカウントの残高情報を取得します。
+
+このツールは、取引前の残高確認や投資可能額の算出に使用します。
+すべての通貨の残高を一度に取得し、利用可能な資金を確認できます。
+
+使用例:
+- 取引前に利用可能な資金を確認したい場合
+- ポートフォリオの総資産価値を計算したい場合
+- 各通貨の保有量を確認したい場合
+- 投資可能額を把握したい場合
+
+注意: このツールを使用するには、環境変数にAPIキーとシークレットが設定されている必要があります。
+
+Returns:
+    AccountBalance: アカウント残高情報
+        - balances: 各通貨の残高情報（通貨コードをキーとする辞書）
+        - permissions: 利用権限情報（APIの各機能に対する権限を示す辞書）
+
+Raises:
+    ValueError: 認証情報が設定されていない場合や、APIエラーが発生した場合""",
+    "place_order": """\
+暗号資産の売買注文を発注します。
+
+このツールは、指定した通貨ペアで新規の売買注文を市場に出すために使用します。
+価格と数量を指定して、指値注文を出すことができます。
+
+使用例:
+- ビットコインを指定価格で購入したい場合
+- イーサリアムを売却して利益を確定したい場合
+- 特定の価格で指値注文を出したい場合
+
+注意: このツールを使用するには、環境変数にAPIキーとシークレットが設定されている必要があります。
+
+Args:
+    currency_pair: 取引する通貨ペア（'btc_jpy': ビットコイン/円、'eth_jpy': イーサリアム/円、'xym_jpy': シンボル/円）
+    order_type: 注文タイプ（'bid': 買い注文、'ask': 売り注文）
+    price: 注文価格（日本円）- 指値注文の場合の1単位あたりの価格
+    quantity: 注文数量 - 売買する暗号資産の量（例: ビットコインの場合は0.01BTCなど）
+
+Returns:
+    OrderResponse: 注文結果情報
+        - filled_amount: 即時約定した数量
+        - unfilled_amount: 未約定の残り数量
+        - order_id: 注文ID（全約定の場合は0）
+        - balances: 注文後の各通貨の残高情報
+
+Raises:
+    ValueError: 認証情報が設定されていない場合や、APIエラーが発生した場合""",
+    "cancel_order": """\
+未約定の暗号資産取引注文をキャンセルします。
+
+このツールは、既に発注済みで未約定（一部約定を含む）の注文をキャンセルするために使用します。
+注文IDを指定してキャンセルでき、任意で通貨ペアも指定できます。
+
+使用例:
+- 価格変動により注文戦略を変更したい場合
+- 誤った注文をキャンセルしたい場合
+- 長時間約定しない注文を取り消したい場合
+
+注意: このツールを使用するには、環境変数にAPIキーとシークレットが設定されている必要があります。
+
+Args:
+    order_id: キャンセルする注文のID（get_open_ordersで取得可能）
+    currency_pair: 通貨ペア（'btc_jpy': ビットコイン/円、'eth_jpy': イーサリアム/円、'xym_jpy': シンボル/円）
+                  指定しない場合、システムは注文IDから自動的に判断します
+
+Returns:
+    CancelOrderResponse: キャンセル結果情報
+        - order_id: キャンセルした注文ID
+        - balances: キャンセル後の各通貨の残高情報
+
+Raises:
+    ValueError: 認証情報が設定されていない場合や、APIエラーが発生した場合""",
+    "get_open_orders": """\
+現在有効な（未約定の）暗号資産取引注文一覧を取得します。
+
+このツールは、現在板に出ている未約定注文（一部約定を含む）の一覧を確認するために使用します。
+特定の通貨ペアでフィルタリングすることも、すべての通貨ペアの注文を取得することもできます。
+
+使用例:
+- 現在の注文状況を確認したい場合
+- キャンセルすべき注文を特定したい場合
+- 注文戦略の進捗を確認したい場合
+
+注意: このツールを使用するには、環境変数にAPIキーとシークレットが設定されている必要があります。
+
+Args:
+    currency_pair: 通貨ペア（'btc_jpy': ビットコイン/円、'eth_jpy': イーサリアム/円、'xym_jpy': シンボル/円）
+                  指定しない場合、すべての通貨ペアの注文が返されます
+
+Returns:
+    OpenOrderList: 未約定注文一覧
+        - open_orders: 注文IDをキーとする注文情報の辞書
+            - currency_pair: 通貨ペア
+            - order_type: 注文タイプ（'bid': 買い、'ask': 売り）
+            - price: 注文価格
+            - quantity: 注文数量
+            - order_time: 注文日時のISO 8601形式の文字列（例: '2023-05-24T15:30:45+09:00'）
+
+Raises:
+    ValueError: 認証情報が設定されていない場合や、APIエラーが発生した場合""",
+    "get_trade_executions": """\
+あなたのアカウントで約定（成立）した取引履歴を取得します。
+
+このツールは、実際に成立した売買取引の記録を確認するために使用します。
+特定の通貨ペアだけの履歴を見たり、取得件数や期間を指定して絞り込んだりできます。
+
+使用例:
+- 過去1ヶ月の取引履歴を確認して収益を計算したい場合
+- ビットコイン取引だけを分析したい場合
+- 最近の20件の取引を確認して取引戦略の成果を評価したい場合
+- 税金申告のために年間の取引記録を取得したい場合
+
+注意: このツールを使用するには、環境変数にAPIキーとシークレットが設定されている必要があります。
+
+Args:
+    currency_pair: 取引通貨ペア（'btc_jpy': ビットコイン/円、'eth_jpy': イーサリアム/円、'xym_jpy': シンボル/円）
+                  指定しない場合、すべての通貨ペアの取引履歴が返されます
+    limit: 取得する履歴の最大件数（1以上、例: 10, 20, 50）
+    start_date: この日付以降の取引を取得（例: '2023-01-01'）
+    end_date: この日付以前の取引を取得（例: '2023-12-31'）
+
+Returns:
+    TradeExecutionList: 約定済み取引履歴
+        - executions: 約定済み取引のリスト（新しい順）
+            - execution_id: 取引ID（約定ID）
+            - currency_pair: 通貨ペア（例: 'btc_jpy'）
+            - trade_side: 取引であなたが行った行動（'buy': 買い、'sell': 売り、'self': 自己取引）
+            - market_role: 取引における役割（'maker': 注文を出して待っていた側、'taker': 即時約定した側、'both': 自己取引の場合）
+            - price: 約定価格（日本円）
+            - quantity: 約定数量（暗号資産の量）
+            - fee_amount: 支払った手数料の金額（日本円）
+            - execution_time: 約定日時（ISO 8601形式の文字列、例: '2023-05-24T15:30:45+09:00'）
+
+Raises:
+    ValueError: 認証情報が設定されていない場合や、limitや日付が無効な場合、APIエラーが発生した場合""",
+    "get_account_snapshot": """\
+未約定の注文一覧と、直近の約定済み取引履歴をまとめて取得します。
+
+このツールは、get_open_ordersとget_trade_executionsの結果をまとめて1回で返します。
+注文状況と取引結果を同時に確認したい場合に、ツールの呼び出しを1回で済ませられます。
+
+使用例:
+- 現在の注文と最近の取引をまとめて確認したい場合
+- 注文戦略の進捗と成果を同時に評価したい場合
+
+注意: このツールを使用するには、環境変数にAPIキーとシークレットが設定されている必要があります。
+
+Args:
+    currency_pair: 通貨ペア（'btc_jpy': ビットコイン/円、'eth_jpy': イーサリアム/円、'xym_jpy': シンボル/円）
+                  指定しない場合、すべての通貨ペアの注文と取引履歴が返されます
+    limit: 取得する取引履歴の最大件数（1以上、例: 10, 20, 50）
+
+Returns:
+    AccountSnapshot: 未約定注文一覧と約定済み取引履歴
+        - open_orders: 未約定注文一覧（get_open_ordersの戻り値と同じ形式）
+        - trade_executions: 約定済み取引履歴（get_trade_executionsの戻り値と同じ形式）
+
+Raises:
+    ValueError: 認証情報が設定されていない場合や、limitが無効な場合、APIエラーが発生した場合""",
+    "get_price_chart": """\
+指定期間の価格チャートデータを取得し、投資判断やトレンド分析に活用します。
+
+このツールは以下の用途で使用されます：
+- 価格トレンドの分析とパターン認識
+- 買い時・売り時の判断材料として
+- サポート・レジスタンスレベルの特定
+- テクニカル分析（移動平均、RSI等の計算基礎データ）
+- 価格変動の要因分析
+
+期間指定のガイドライン:
+- 1分足・5分足: 数時間～1日分のデータが適切です
+- 1時間足: 1週間～1ヶ月分のデータが適切です
+- 日足: 1ヶ月～6ヶ月分のデータが適切です
+- 週足: 6ヶ月～2年分のデータが適切です
+
+注意: 極端に長い期間（例: 1分足で1年分）を指定すると、
+データ量が膨大になり処理に時間がかかる場合があります。
+
+Args:
+    currency_pair: 通貨ペア（'btc_jpy': ビットコイン/円、'eth_jpy': イーサリアム/円、'xym_jpy': シンボル/円）
+    timeframe: 時間足（'1': 1分足、'5': 5分足、'15': 15分足、'30': 30分足、'60': 1時間足、
+              '240': 4時間足、'480': 8時間足、'720': 12時間足、'D': 日足、'W': 週足）
+    start_date: 開始日時（ISO形式: 'YYYY-MM-DDTHH:MM:SS'）
+    end_date: 終了日時（ISO形式: 'YYYY-MM-DDTHH:MM:SS'）
+
+Returns:
+    PriceChartData: 価格チャートデータ
+        - currency_pair: 通貨ペア
+        - timeframe: 時間足の表示名（例: '1時間足'）
+        - start_date: 開始日時（ISO 8601形式）
+        - end_date: 終了日時（ISO 8601形式）
+        - candlesticks: ローソク足データのリスト（時系列順）
+            - timestamp: ISO 8601形式の日時文字列
+            - open_price: 始値
+            - high_price: 高値
+            - low_price: 安値
+            - close_price: 終値
+            - volume: 出来高
+        - data_count: データ件数
+
+Raises:
+    ValueError: 日付形式が不正な場合や、APIエラーが発生した場合""",
+}
@@ -0,0 +1,32 @@
+"""
+MCPツールの戻り値の変換
+
+件数の多いデータを返すツールで使用する、コンパクトなツール結果を生成します。
+"""
+
+from typing import Any
+
+import orjson
+import pydantic_core
+from mcp.types import CallToolResult, TextContent
+
+
+def compact_result(result: Any) -> CallToolResult:
+    """
+    ツールの戻り値を、インデントなしのJSONテキストと構造化データを持つCallToolResultに変換する
+
+    FastMCPの既定の変換ではテキスト部分がインデント付きのJSONになり、板情報や取引履歴のように
+    件数の多いデータではペイロードが大きくなるため、構造化データを一度だけ生成して
+    そのままコンパクトなJSONとして出力します。
+
+    Args:
+        result: ツールの戻り値（データモデル）
+
+    Returns:
+        CallToolResult
+    """
+    structured = pydantic_core.to_jsonable_python(result)
+    return CallToolResult(
+        content=[TextContent(type="text", text=orjson.dumps(structured).decode())],
+        structuredContent=structured,
+    )